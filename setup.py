@@ -18,6 +18,9 @@ setup(
         "scikit-learn",
         "jupyter",
         "python-dotenv",
+        "pymongo[snappy,zstd]",
+        "openpyxl",
+        "python-calamine",
     ],
     # Define the actual package name
     py_modules=["analytics"],
@@ -1,12 +1,15 @@
-from typing import Dict, List, Any, Optional, Union
-from pymongo import MongoClient
+from typing import Dict, Iterable, List, Any, Optional, Union
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from pymongo import ASCENDING, IndexModel, InsertOne, MongoClient
 from pymongo.cursor import Cursor
 from pymongo.collection import Collection
 from pymongo.database import Database
+from pymongo.write_concern import WriteConcern
 import pandas as pd
 import json
 from datetime import datetime
 import logging
+import threading
 from analytics.datasets.boreport import BOReport
 
 # Configure logging
@@ -17,6 +20,48 @@ logging.basicConfig(
 )
 logger = logging.getLogger("MongoDB")
 
+# Wire compressors offered to the server, in order of preference. Ones whose
+# Python package is not installed are skipped by pymongo with a warning.
+COMPRESSORS = "zstd,snappy"
+
+# MongoClient instances shared across MongoDB objects, keyed by connection string
+_clients: Dict[Optional[str], MongoClient] = {}
+_clients_lock = threading.Lock()
+
+
+def _get_client(connection_string: Optional[str] = None) -> MongoClient:
+    """
+    Return a shared MongoClient for the connection string, creating it on first use.
+
+    Args:
+        connection_string (Optional[str]): MongoDB connection string. Defaults to None (localhost).
+
+    Returns:
+        MongoClient: The cached client.
+    """
+    with _clients_lock:
+        if connection_string not in _clients:
+            _clients[connection_string] = MongoClient(
+                connection_string, compressors=COMPRESSORS
+            )
+        return _clients[connection_string]
+
+
+def close_all() -> None:
+    """
+    Close every cached MongoClient and clear the cache.
+
+    MongoDB objects created before this call keep a reference to their closed
+    client and raise InvalidOperation on their next operation; create new
+    MongoDB objects afterwards instead of reusing them.
+    """
+    with _clients_lock:
+        clients = list(_clients.values())
+        _clients.clear()
+
+    for client in clients:
+        client.close()
+
 
 class MongoDB:
     """
@@ -24,7 +69,11 @@ class MongoDB:
     """
 
     def __init__(
-        self, database: str, collection: str, connection_string: Optional[str] = None
+        self,
+        database: str,
+        collection: str,
+        connection_string: Optional[str] = None,
+        unacknowledged: bool = False,
     ) -> None:
         """
         Initialize the MongoDB object.
@@ -33,12 +82,17 @@ class MongoDB:
             database (str): Name of the database.
             collection (str): Name of the collection.
             connection_string (Optional[str]): MongoDB connection string. Defaults to None (localhost).
+            unacknowledged (bool): Use w=0 (unacknowledged) writes on the collection.
+                Writes no longer wait for the server, so insert errors are silent.
+                Reads are unaffected. Defaults to False.
         """
-        self.client = (
-            MongoClient(connection_string) if connection_string else MongoClient()
-        )
+        self.client = _get_client(connection_string)
         self.db: Database = self.client[database]
-        self.collection: Collection = self.db[collection]
+        self.collection: Collection = (
+            self.db.get_collection(collection, write_concern=WriteConcern(w=0))
+            if unacknowledged
+            else self.db[collection]
+        )
 
     def read_data(self, query: Dict[str, Any] = {}) -> Cursor:
         """
@@ -52,13 +106,28 @@ class MongoDB:
         """
         return self.collection.find(query)
 
-    def insert_data(self, data: Union[List[Dict[str, Any]], pd.DataFrame]) -> None:
+    def insert_data(
+        self,
+        data: Union[List[Dict[str, Any]], pd.DataFrame],
+        fast_insert: bool = False,
+        batch_size: int = 50,
+        ordered: bool = False,
+        drop_indexes_before_bulk: bool = False,
+    ) -> None:
         """
         Insert data into the MongoDB collection.
 
         Args:
             data (Union[List[Dict[str, Any]], pd.DataFrame]): The data to insert.
                 Can be a list of dictionaries or a pandas DataFrame.
+            fast_insert (bool): Insert with w=0 (unacknowledged) write concern.
+                Faster for bulk loads, but insert errors are not reported. Defaults to False.
+            batch_size (int): Number of documents sent per insert_many call. Defaults to 50.
+            ordered (bool): Whether the server must insert documents in order and stop
+                at the first error. Defaults to False.
+            drop_indexes_before_bulk (bool): Drop plain secondary indexes before inserting
+                and rebuild them afterwards, which is faster for large loads. Unique, text
+                and TTL indexes are left in place. Defaults to False.
 
         Raises:
             ValueError: If data is not a list of dictionaries or a pandas DataFrame.
@@ -73,11 +142,125 @@ class MongoDB:
                 "Data must be a pandas DataFrame or a list of dictionaries"
             )
 
-        if records:
-            self.collection.insert_many(records)
-        else:
+        collection = (
+            self.collection.with_options(write_concern=WriteConcern(w=0))
+            if fast_insert
+            else self.collection
+        )
+
+        if not records:
+            logger.warning("No records to insert")
+            return
+
+        indexes = self._drop_indexes() if drop_indexes_before_bulk else []
+        try:
+            for start in range(0, len(records), batch_size):
+                collection.insert_many(
+                    records[start : start + batch_size], ordered=ordered
+                )
+        finally:
+            if indexes:
+                self.collection.create_indexes(indexes)
+
+    def ensure_indexes(self, fields: List[str]) -> List[str]:
+        """
+        Create ascending single-field indexes on the collection if they do not exist.
+
+        Args:
+            fields (List[str]): Field names to index.
+
+        Returns:
+            List[str]: Names of the indexes.
+        """
+        return self.collection.create_indexes(
+            [IndexModel([(field, ASCENDING)]) for field in fields]
+        )
+
+    def _drop_indexes(self) -> List[IndexModel]:
+        """
+        Drop plain secondary indexes, returning models that can recreate them.
+
+        Unique, text and TTL indexes are kept in place, so their constraints
+        still apply during the insert and the rebuild cannot fail on them.
+
+        Returns:
+            List[IndexModel]: The dropped indexes.
+        """
+        indexes = []
+        for name, info in self.collection.index_information().items():
+            if (
+                name == "_id_"
+                or info.get("unique")
+                or "expireAfterSeconds" in info
+                or any(kind == "text" for _, kind in info["key"])
+            ):
+                continue
+            options = {k: v for k, v in info.items() if k not in ("key", "v", "ns")}
+            indexes.append(IndexModel(info["key"], name=name, **options))
+
+        for index in indexes:
+            self.collection.drop_index(index.document["name"])
+
+        return indexes
+
+    def bulk_insert(self, records: List[Dict[str, Any]], batch_size: int = 100) -> None:
+        """
+        Insert records with unordered bulk_write calls of InsertOne operations.
+
+        Args:
+            records (List[Dict[str, Any]]): The records to insert.
+            batch_size (int): Number of documents per bulk_write call. Defaults to 100.
+        """
+        if not records:
+            logger.warning("No records to insert")
+            return
+
+        for start in range(0, len(records), batch_size):
+            self.collection.bulk_write(
+                [InsertOne(doc) for doc in records[start : start + batch_size]],
+                ordered=False,
+            )
+
+    def insert_stream(
+        self, batches: Iterable[List[Dict[str, Any]]], max_workers: int = 1
+    ) -> int:
+        """
+        Insert batches of records into the MongoDB collection as they are produced.
+
+        Batches are dispatched to a thread pool with insert_many(ordered=False).
+        At most two batches per worker are in flight at once, so memory stays
+        bounded when paired with generators such as BOReport.iter_records().
+
+        Args:
+            batches (Iterable[List[Dict[str, Any]]]): Iterable of record batches.
+            max_workers (int): Number of concurrent insert threads. Defaults to 1.
+
+        Returns:
+            int: Total number of records sent to MongoDB.
+        """
+        total = 0
+        pending = set()
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for batch in batches:
+                if not batch:
+                    continue
+                if len(pending) >= max_workers * 2:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        future.result()
+                pending.add(
+                    executor.submit(self.collection.insert_many, batch, ordered=False)
+                )
+                total += len(batch)
+
+            for future in pending:
+                future.result()
+
+        if not total:
             logger.warning("No records to insert")
 
+        return total
+
     def _prepare_dataframe_for_mongo(self, df: pd.DataFrame) -> List[Dict[str, Any]]:
         """
         Convert DataFrame to MongoDB compatible format, handling NaT values.
@@ -88,21 +271,47 @@ class MongoDB:
         Returns:
             List[Dict[str, Any]]: List of dictionaries ready for MongoDB insertion.
         """
-        # Reset index if it's not default (e.g., if date is the index)
-        if not df.index.equals(pd.RangeIndex(len(df))):
+        # Reset index if it's not default (e.g., if date is the index); a
+        # RangeIndex is checked from its bounds, anything else element-wise
+        index = df.index
+        if isinstance(index, pd.RangeIndex):
+            is_default = index.start == 0 and index.step == 1 and index.stop == len(df)
+        else:
+            is_default = index.equals(pd.RangeIndex(len(df)))
+        if not is_default:
             df = df.reset_index()
 
-        # Handle datetime columns to prevent NaT issues
-        # First identify datetime columns
-        datetime_columns = df.select_dtypes(include=["datetime64"]).columns.tolist()
+        # Handle datetime columns to prevent NaT issues, and nullable extension
+        # columns (Int64, boolean, Float64, ...) whose values itertuples would
+        # return as NumPy scalars and pd.NA, which BSON cannot encode.
+        # Identify both from the dtypes alone, without building the
+        # intermediate frame that select_dtypes returns
+        object_columns = [
+            col
+            for col, dtype in df.dtypes.items()
+            if pd.api.types.is_datetime64_any_dtype(dtype)
+            or (
+                isinstance(dtype, pd.api.extensions.ExtensionDtype)
+                and dtype.na_value is pd.NA
+            )
+        ]
 
-        # Convert datetime columns to string format before conversion to JSON
-        df_copy = df.copy()
-        for col in datetime_columns:
-            df_copy[col] = df_copy[col].astype(str).replace("NaT", None)
+        # Cast those columns to plain Python objects with missing values as None,
+        # without copying the whole frame; other frames go straight to record conversion
+        if object_columns:
+            subset = df[object_columns]
+            df = df.assign(
+                **subset.astype(object).where(subset.notna(), None).to_dict("series")
+            )
 
-        # Convert to records format
-        records = df_copy.to_dict(orient="records")
+        # Convert to records format; itertuples avoids a Series per row and the
+        # local aliases keep dict/zip lookups out of the globals in the hot loop
+        cols = df.columns.tolist()
+        dict_ = dict
+        zip_ = zip
+        records = [
+            dict_(zip_(cols, row)) for row in df.itertuples(index=False, name=None)
+        ]
 
         return records
 
@@ -116,32 +325,36 @@ if __name__ == "__main__":
             r"C:\Users\izzaz\Documents\2 Areas\GitHub\analytics-work\data\boreport_test.xlsx"
         )
 
-        # Read and process the data
-        logger.info("Reading data from Excel file")
-        raw_data = bo_report.read_data()
-        if raw_data is None:
-            logger.error("Failed to read data from the Excel file")
-            exit(1)
-
         # Initialize MongoDB object
         logger.info("Initializing MongoDB connection")
-        mongo = MongoDB(database="deep-diver-v2", collection="boreport")
+        mongo = MongoDB(
+            database="deep-diver-v2", collection="boreport", unacknowledged=True
+        )
+
+        # Stream raw data from the Excel file into MongoDB collection
+        logger.info("Streaming records from Excel file into MongoDB")
+        with bo_report:
+            inserted = mongo.insert_stream(bo_report.iter_records(2000), max_workers=8)
+        if not inserted:
+            logger.error("Failed to read data from the Excel file")
+            exit(1)
+        logger.info("Data insertion complete: %d records inserted", inserted)
 
-        # Insert raw data into MongoDB collection
-        logger.info(f"Inserting {len(raw_data)} records into MongoDB")
-        mongo.insert_data(raw_data)
-        logger.info("Data insertion complete")
+        # Index the commonly queried fields once the bulk load is done
+        logger.info("Ensuring indexes on MongoDB collection")
+        mongo.ensure_indexes(["Probability 90% Date", " Channel"])
 
         # Read data from MongoDB collection
         logger.info("Retrieving sample data from MongoDB")
         cursor = mongo.read_data()
         sample_count = 0
         for i, doc in enumerate(cursor):
-            logger.debug(f"Document {i}: {doc}")
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Document %d: %s", i, doc)
             sample_count += 1
             if i >= 2:  # Print only first 3 documents
                 break
-        logger.info(f"Retrieved {sample_count} sample documents")
+        logger.info("Retrieved %d sample documents", sample_count)
 
     except Exception as e:
-        logger.error(f"An error occurred: {e}", exc_info=True)
+        logger.error("An error occurred: %s", e, exc_info=True)
@@ -2,7 +2,9 @@ import pandas as pd
 import warnings
 from dotenv import load_dotenv
 import os
+from itertools import islice
 from pathlib import Path
+from openpyxl import load_workbook
 
 warnings.filterwarnings("ignore", module="openpyxl")
 
@@ -10,6 +12,53 @@ load_dotenv()
 
 BO_REPORT_PATH = os.getenv("BOREPORT_PATH")
 
+# Column dtypes applied right after reading. Columns missing from the sheet are skipped.
+BO_REPORT_DTYPES = {
+    "Funn Status": "category",
+    " Channel": "category",
+    "Blk Cluster": "category",
+}
+
+
+def _normalize_headers(headers):
+    """
+    Turn a raw header row into unique string column names, the way read_excel does.
+
+    Blank cells become "Unnamed: N" and repeated names get a ".1", ".2", ... suffix.
+
+    Args:
+        headers (iterable): Raw header cell values.
+
+    Returns:
+        list[str]: The normalized column names.
+    """
+    names = []
+    counts = {}
+    for i, header in enumerate(headers):
+        name = f"Unnamed: {i}" if header is None or header == "" else str(header)
+        if name in counts:
+            base = name
+            while name in counts:
+                counts[base] += 1
+                name = f"{base}.{counts[base]}"
+        counts[name] = 0
+        names.append(name)
+    return names
+
+
+def _get_worksheet(wb, sheet_name=0):
+    """
+    Look up a worksheet by index or name, matching read_excel's sheet_name.
+
+    Args:
+        wb (openpyxl.Workbook): The open workbook.
+        sheet_name (int or str, optional): Sheet index or name. Defaults to 0 (first sheet).
+
+    Returns:
+        openpyxl worksheet: The selected worksheet.
+    """
+    return wb.worksheets[sheet_name] if isinstance(sheet_name, int) else wb[sheet_name]
+
 
 class BOReport:
     """
@@ -18,35 +67,74 @@ class BOReport:
     Example usage:
 
     ```python
-    bo_report = BOReport()
-    data = bo_report.read_data()
-    processed_data = bo_report.process_data()
+    with BOReport() as bo_report:
+        data = bo_report.read_data()
+        processed_data = bo_report.process_data()
     ```
     """
 
-    def __init__(self, file_path=None):
+    def __init__(self, file_path=None, columns=None, dtypes=None):
         """
         Initialize the BOReport object.
 
         Example usage:
 
         ```python
-        bo_report = BOReport()
-        data = bo_report.read_data()
-        processed_data = bo_report.process_data()
+        with BOReport() as bo_report:
+            data = bo_report.read_data()
+            processed_data = bo_report.process_data()
         ```
 
         Args:
             file_path (str, optional): Path to the BO report file. Defaults to BO_REPORT_PATH.
+            columns (list, optional): Columns to load. Defaults to None (all columns).
+            dtypes (dict, optional): Column dtypes to apply after reading. Defaults to BO_REPORT_DTYPES.
         """
         self.file_path = file_path if file_path else BO_REPORT_PATH
+        self.columns = columns
+        self.dtypes = BO_REPORT_DTYPES if dtypes is None else dtypes
         self.data = None
         self.processed_data = None
+        self._excel_file = None
+        self._in_context = False
 
-    def read_data(self):
+    def _get_excel_file(self):
+        """
+        Open the report as a pd.ExcelFile once and reuse it for later reads.
+
+        Returns:
+            pd.ExcelFile: The open workbook.
+        """
+        if self._excel_file is None:
+            self._excel_file = pd.ExcelFile(self.file_path, engine="calamine")
+        return self._excel_file
+
+    def close(self):
+        """
+        Close the open workbook handle, if any.
+        """
+        if self._excel_file is not None:
+            self._excel_file.close()
+            self._excel_file = None
+
+    def __enter__(self):
+        self._in_context = True
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._in_context = False
+        self.close()
+
+    def read_data(self, sheet_name=0):
         """
         Load data from the BO report file.
 
+        Inside a ``with`` block the workbook stays open for later reads until the
+        block exits; otherwise it is closed as soon as the sheet is parsed.
+
+        Args:
+            sheet_name (int or str, optional): Sheet index or name to load. Defaults to 0 (first sheet).
+
         Returns:
             pd.DataFrame: The loaded data.
         """
@@ -59,12 +147,110 @@ class BOReport:
             return None
 
         try:
-            self.data = pd.read_excel(self.file_path)
+            try:
+                excel_file = self._get_excel_file()
+            except (ImportError, ValueError):
+                # python-calamine not installed (or pandas too old to know it)
+                excel_file = None
+
+            if excel_file is not None:
+                # Cast after parsing: dtype="category" inside the parser sorts the
+                # raw values and fails on columns that mix numbers and text
+                try:
+                    data = excel_file.parse(sheet_name, usecols=self.columns)
+                finally:
+                    if not self._in_context:
+                        self.close()
+                self.data = data.astype(self._get_dtypes(data.columns))
+            else:
+                self.data = self._read_with_openpyxl(sheet_name)
             return self.data
         except Exception as e:
             print(f"Error loading data: {e}")
             return None
 
+    def _read_with_openpyxl(self, sheet_name=0):
+        """
+        Load a sheet using openpyxl in read-only mode.
+
+        Rows are streamed with ``iter_rows`` instead of building the full
+        workbook in memory, and the first row is used as the header. The
+        configured columns and dtypes are then applied.
+
+        Args:
+            sheet_name (int or str, optional): Sheet index or name to load. Defaults to 0.
+
+        Returns:
+            pd.DataFrame: The loaded data.
+        """
+        wb = load_workbook(self.file_path, read_only=True, data_only=True)
+        try:
+            rows = _get_worksheet(wb, sheet_name).iter_rows(values_only=True)
+            headers = next(rows, None)
+            if headers is None:
+                return pd.DataFrame()
+            data = pd.DataFrame(list(rows), columns=_normalize_headers(headers))
+        finally:
+            wb.close()
+
+        if self.columns is not None:
+            data = data[self.columns]
+        return data.astype(self._get_dtypes(data.columns))
+
+    def _get_dtypes(self, columns):
+        """
+        Return the configured dtypes restricted to the columns that were read.
+
+        Args:
+            columns (list): Columns present in the loaded data.
+
+        Returns:
+            dict: Column name to dtype mapping.
+        """
+        return {col: dtype for col, dtype in self.dtypes.items() if col in columns}
+
+    def iter_records(self, batch_size=1000, sheet_name=0):
+        """
+        Stream the BO report as batches of records without loading the whole sheet.
+
+        Example usage:
+
+        ```python
+        bo_report = BOReport()
+        for batch in bo_report.iter_records(batch_size=2000):
+            ...
+        ```
+
+        Args:
+            batch_size (int, optional): Number of rows per batch. Defaults to 1000.
+            sheet_name (int or str, optional): Sheet index or name to stream. Defaults to 0 (first sheet).
+
+        Yields:
+            list[dict]: A list of up to batch_size records keyed by the header row.
+        """
+        if not self.file_path:
+            print("Error: No file path provided")
+            return
+
+        if not Path(self.file_path).exists():
+            print(f"Error: File not found at {self.file_path}")
+            return
+
+        wb = load_workbook(self.file_path, read_only=True, data_only=True)
+        try:
+            rows = _get_worksheet(wb, sheet_name).iter_rows(values_only=True)
+            headers = next(rows, None)
+            if headers is None:
+                return
+            headers = _normalize_headers(headers)
+            while True:
+                batch = [dict(zip(headers, row)) for row in islice(rows, batch_size)]
+                if not batch:
+                    break
+                yield batch
+        finally:
+            wb.close()
+
     def process_data(self):
         """
         Process the loaded data.
@@ -77,14 +263,13 @@ class BOReport:
 
         if self.data is not None:
             try:
+                # Categorize only the filter columns so the comparisons run on codes
+                funn_status = self.data["Funn Status"].astype("category")
+                channel = self.data[" Channel"].astype("category")
                 self.processed_data = (
                     self.data.loc[
-                        (self.data["Funn Status"] != "Lost")
-                        & (
-                            self.data[" Channel"].isin(
-                                ["ONLINE", "INSIDE SALES", "DEALER"]
-                            )
-                        )
+                        (funn_status != "Lost")
+                        & (channel.isin(["ONLINE", "INSIDE SALES", "DEALER"]))
                     ]
                     .astype(
                         {
@@ -92,14 +277,16 @@ class BOReport:
                             "Blk Cluster": "category",
                         }
                     )
+                    # Parse dates after filtering, caching repeated date strings
                     .assign(
-                        date=pd.to_datetime(
-                            self.data["Probability 90% Date"],
+                        date=lambda df: pd.to_datetime(
+                            df["Probability 90% Date"],
                             format="%Y-%m-%d",
                             errors="coerce",
+                            cache=True,
                         ),
-                        Dob=pd.to_datetime(
-                            self.data["Dob"], format="%Y-%m-%d", errors="coerce"
+                        Dob=lambda df: pd.to_datetime(
+                            df["Dob"], format="%Y-%m-%d", errors="coerce", cache=True
                         ),
                     )
                     .dropna(subset=["date"])
@@ -118,22 +305,22 @@ class BOReport:
 
 
 if __name__ == "__main__":
-    bo_report = BOReport()
-    if bo_report.file_path:
-        data = bo_report.read_data()
-        if data is not None:
-            print(f"Data loaded successfully. Shape: {data.shape}")
-            print("Sample data:")
-            print(data.head())
+    with BOReport() as bo_report:
+        if bo_report.file_path:
+            data = bo_report.read_data()
+            if data is not None:
+                print(f"Data loaded successfully. Shape: {data.shape}")
+                print("Sample data:")
+                print(data.head())
 
-            processed_data = bo_report.process_data()
-            if processed_data is not None:
-                print(f"\nProcessed data shape: {processed_data.shape}")
-                print("Sample processed data:")
-                print(processed_data.head())
-            else:
-                print("Failed to process data")
-    else:
-        print(
-            "No BO_REPORT_PATH environment variable set. Please set it or provide a file path."
-        )
+                processed_data = bo_report.process_data()
+                if processed_data is not None:
+                    print(f"\nProcessed data shape: {processed_data.shape}")
+                    print("Sample processed data:")
+                    print(processed_data.head())
+                else:
+                    print("Failed to process data")
+        else:
+            print(
+                "No BO_REPORT_PATH environment variable set. Please set it or provide a file path."
+            )
@@ -1,5 +1,7 @@
 import os
 import logging
+from functools import lru_cache
+import numpy as np
 import pandas as pd
 from typing import Dict, List, Optional, Any, Union
 from datetime import datetime, timedelta
@@ -30,6 +32,37 @@ logger = logging.getLogger("GA4Report")
 # Get GA4 property ID from environment variable
 GA4_PROPERTY_ID = os.getenv("GOOGLE_ANALYTICS_PROPERTY")
 
+# Rows requested per RunReportRequest page
+GA4_PAGE_SIZE = 10000
+
+
+def _to_number(value: str) -> Union[float, str]:
+    """
+    Convert a GA4 metric value to float, returning it unchanged if it is not numeric.
+    """
+    try:
+        return float(value)
+    except ValueError:
+        return value
+
+
+@lru_cache(maxsize=256)
+def _dimension(name: str) -> Dimension:
+    """
+    Return a cached Dimension for the given name.
+
+    RunReportRequest copies the message on construction, so sharing instances is safe.
+    """
+    return Dimension(name=name)
+
+
+@lru_cache(maxsize=256)
+def _metric(name: str) -> Metric:
+    """
+    Return a cached Metric for the given name.
+    """
+    return Metric(name=name)
+
 
 class GA4Report:
     """
@@ -84,7 +117,7 @@ class GA4Report:
             self.client = BetaAnalyticsDataClient()
             logger.info("GA4 client initialized successfully")
         except Exception as e:
-            logger.error(f"Failed to initialize GA4 client: {e}")
+            logger.error("Failed to initialize GA4 client: %s", e)
             raise
 
     def fetch_data(
@@ -107,7 +140,8 @@ class GA4Report:
                 Each filter should have 'field', 'operator', and 'value' keys.
             order_by (Optional[List[Dict[str, Any]]]): List of order by dictionaries.
                 Each should have 'field' and 'desc' (boolean) keys.
-            row_limit (int): Maximum number of rows to return. Defaults to 10000.
+            row_limit (int): Maximum number of rows to return. Requests are paged in
+                chunks of GA4_PAGE_SIZE rows, so this may exceed a single page. Defaults to 10000.
 
         Returns:
             pd.DataFrame: DataFrame containing the requested GA4 data.
@@ -121,15 +155,15 @@ class GA4Report:
             try:
                 self._initialize_client()
             except Exception as e:
-                logger.error(f"Failed to initialize client: {e}")
+                logger.error("Failed to initialize client: %s", e)
                 raise ConnectionError(f"Failed to initialize GA4 client: {e}")
 
         try:
             # Prepare dimensions
-            dimension_list = [Dimension(name=d) for d in dimensions]
+            dimension_list = [_dimension(d) for d in dimensions]
 
             # Prepare metrics
-            metric_list = [Metric(name=m) for m in metrics]
+            metric_list = [_metric(m) for m in metrics]
 
             # Prepare date range
             date_ranges = [DateRange(start_date=date_range[0], end_date=date_range[1])]
@@ -150,7 +184,7 @@ class GA4Report:
                 dimensions=dimension_list,
                 metrics=metric_list,
                 date_ranges=date_ranges,
-                limit=row_limit,
+                limit=min(row_limit, GA4_PAGE_SIZE),
             )
 
             # Add filters if available
@@ -163,21 +197,36 @@ class GA4Report:
 
             # Run the report
             logger.info(
-                f"Fetching GA4 data with {len(dimensions)} dimensions and {len(metrics)} metrics"
+                "Fetching GA4 data with %d dimensions and %d metrics",
+                len(dimensions),
+                len(metrics),
             )
             response = self.client.run_report(request)
 
-            # Process the response
-            self.data = self._process_response(response, dimensions, metrics)
-            logger.info(f"Retrieved {len(self.data)} rows from GA4")
+            # Process the response, paging with offset until row_limit or the
+            # total row count is reached
+            frames = [self._process_response(response, dimensions, metrics)]
+            fetched = len(frames[0])
+            target = min(response.row_count, row_limit)
+            while fetched < target and len(frames[-1]):
+                request.offset = fetched
+                request.limit = min(GA4_PAGE_SIZE, target - fetched)
+                response = self.client.run_report(request)
+                frames.append(self._process_response(response, dimensions, metrics))
+                fetched += len(frames[-1])
+
+            self.data = (
+                pd.concat(frames, ignore_index=True) if len(frames) > 1 else frames[0]
+            )
+            logger.info("Retrieved %d rows from GA4", len(self.data))
 
             return self.data
 
         except ValueError as e:
-            logger.error(f"Invalid request parameters: {e}")
+            logger.error("Invalid request parameters: %s", e)
             raise
         except Exception as e:
-            logger.error(f"Error fetching GA4 data: {e}")
+            logger.error("Error fetching GA4 data: %s", e)
             raise
 
     def _build_filters(self, filters: List[Dict[str, Any]]) -> FilterExpression:
@@ -249,26 +298,34 @@ class GA4Report:
         Returns:
             pd.DataFrame: DataFrame containing the processed data.
         """
-        rows = []
-
-        for row in response.rows:
-            row_dict = {}
-
-            # Add dimensions
-            for i, dimension in enumerate(row.dimension_values):
-                row_dict[dimensions[i]] = dimension.value
-
-            # Add metrics
-            for i, metric in enumerate(row.metric_values):
-                row_dict[metrics[i]] = (
-                    float(metric.value)
-                    if metric.value.replace(".", "", 1).isdigit()
-                    else metric.value
-                )
+        # Fill preallocated arrays sized to the response in a single pass
+        rows = response.rows
+        dimension_values = np.empty((len(rows), len(dimensions)), dtype=object)
+        metric_values = np.empty((len(rows), len(metrics)), dtype=object)
+
+        for i, row in enumerate(rows):
+            dimension_values[i] = [
+                dimension.value for dimension in row.dimension_values
+            ]
+            metric_values[i] = [metric.value for metric in row.metric_values]
+
+        df = pd.concat(
+            [
+                pd.DataFrame(dimension_values, columns=dimensions),
+                pd.DataFrame(metric_values, columns=metrics),
+            ],
+            axis=1,
+        )
 
-            rows.append(row_dict)
+        # Coerce metric columns to float in bulk, falling back to per-value
+        # conversion for columns that mix numeric and non-numeric values
+        for metric in metrics:
+            try:
+                df[metric] = pd.to_numeric(df[metric]).astype(float)
+            except (ValueError, TypeError):
+                df[metric] = df[metric].map(_to_number)
 
-        return pd.DataFrame(rows)
+        return df
 
     def process_data(
         self, custom_processing: Optional[callable] = None
@@ -297,12 +354,12 @@ class GA4Report:
                 self.processed_data = self.data
 
             logger.info(
-                f"Data processed successfully. Shape: {self.processed_data.shape}"
+                "Data processed successfully. Shape: %s", self.processed_data.shape
             )
             return self.processed_data
 
         except Exception as e:
-            logger.error(f"Error processing data: {e}")
+            logger.error("Error processing data: %s", e)
             raise
 
 
@@ -463,12 +520,12 @@ def run_interactive_cli() -> None:
         print("\nThank you for using Deep Diver Data!")
 
     except ValueError as e:
-        logger.error(f"Input error: {e}")
+        logger.error("Input error: %s", e)
         print(f"Error: {e}")
     except KeyboardInterrupt:
         print("\nOperation cancelled by user.")
     except Exception as e:
-        logger.error(f"Error in GA4Report CLI: {e}", exc_info=True)
+        logger.error("Error in GA4Report CLI: %s", e, exc_info=True)
         print(f"An error occurred: {e}")
 
 